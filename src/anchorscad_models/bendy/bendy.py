@@ -105,6 +105,8 @@ def build(self) -> ad.Maker:
         cage = self.box_node()
         maker = self.cage_node(cage).at()
 
+        # Every slit is placed relative to the same corner of the cage.
+        top_corner = maker.at('face_corner', 'top', 0)
         for row in range(self.rows):
             col_offs = 0 if row % 2 == 0 else 0.5
 
@@ -117,7 +119,7 @@ def build(self) -> ad.Maker:
                 
                 maker.add_at(
                     self.slit_end_shape.solid(('slit', row, 'front')).at('face_corner', 'front', 0),
-                    'face_corner', 'top', 0, pre=position)
+                    post=position * top_corner)
             else:
                 cols = self.cols
 
@@ -129,7 +131,7 @@ def build(self) -> ad.Maker:
 
                 maker.add_at(
                     self.slit_shape.solid(('slit', row, col)).at('face_corner', 'front', 0),
-                    'face_corner', 'top', 0, pre=position)
+                    post=position * top_corner)
 
             if col_offs > 0:
                 position = ad.translate([
@@ -139,7 +141,7 @@ def build(self) -> ad.Maker:
                 
                 maker.add_at(
                     self.slit_end_shape.solid(('slit', row, 'back')).at('face_corner', 'front', 0),
-                    'face_corner', 'top', 0, pre=position)
+                    post=position * top_corner)
 
         return maker
     
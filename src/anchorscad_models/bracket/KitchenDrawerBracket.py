@@ -510,7 +510,7 @@ def build(self) -> ad.Maker:
                      'front_cut_shape', 'centre'
                      )
         
-        cut_extents = self.outline.drawer_cut_path.extents()
+        cut_extents = self.outline.cut_extents
         width = cut_extents[1][0] - cut_extents[0][0]
         
         height_v = (maker.at('upper_notch') * ad.GVector((0, 0, 0))
@@ -209,7 +209,7 @@ def build(self) -> ad.Maker:
         for i, (anchor,) in enumerate(self.screw_mounts):
             maker.add_at(
                 screw_mount_shape.solid(('mount', i)).at('top'),
-                anchor=anchor, post=ad.translate((0, 0, 0)))
+                anchor=anchor)
             maker.add_at(
                 tap_screw_hole.composite(('screw_hole', i)).at('top'),
                 ('mount', i), 'top')
@@ -281,12 +281,13 @@ def build(self) -> ad.Maker:
                                post=ad.ROTY_180 * ad.ROTZ_90 * ad.tranX(2.2))
         
         button_hole_shape = self.button_hole_node()
+        button_hole_xform = ad.ROTX_180 * ad.tranZ(EPSILON)
         for i in range(3):
             pos = self._find_button_hole_position(final_maker, i)
             
             final_maker.add_at(
                 button_hole_shape.hole(('button_hole', i)).colour('red').at('top'),
-                post=pos * ad.ROTX_180 * ad.tranZ(EPSILON))
+                post=pos * button_hole_xform)
         
         if self.top_case:
             pcb_mounting_hole_shape = self.pcb_mounting_hole_node()
@@ -17,32 +17,29 @@
 
 
 Z_DELTA=tranZ(-0.01)
+EXPANDER_XFORM=Z_DELTA * ROTX_180
 
 def box_expander(expansion_size=None, actual_size=None, post=None):
     '''
     '''
+    post_xform = post * EXPANDER_XFORM if post else EXPANDER_XFORM
     def expander(maker, name, anchor, box):
         if actual_size:
             expanded_size = GVector(actual_size)
         else:
             expanded_size = GVector(expansion_size) + box.size
         new_shape = ad.Box(expanded_size.A3)
-        post_xform = Z_DELTA * ROTX_180
-        if post:
-            post_xform = post *  post_xform
         maker.add_at(new_shape.solid((name, 'outer')).at(*anchor[0], **anchor[1]),
                      name, *anchor[0], **anchor[1], post=post_xform)
     return expander
 
 
 def cyl_expander(expansion_r, post=None):
+    post_xform = post * EXPANDER_XFORM if post else EXPANDER_XFORM
     def expander(maker, name, anchor, cyl):
         expanded_r = expansion_r + cyl.r_base
         params = ad.non_defaults_dict(cyl, include=('fn', 'fa', 'fs'))
         new_shape = ad.Cylinder(h=cyl.h, r=expanded_r, **params)
-        post_xform = Z_DELTA * ROTX_180
-        if post:
-            post_xform = post *  post_xform
         maker.add_at(new_shape.solid((name, 'outer')).at(*anchor[0], **anchor[1]),
                      name, *anchor[0], **anchor[1], post=post_xform)
     return expander
@@ -247,8 +244,14 @@ def build(self) -> ad.Maker:
 
         params = ad.non_defaults_dict_include(self, include=('fn', 'fa', 'fs'))
 
+        # Holes and access shapes with identical parameters share a single
+        # shape instance.
+        mount_holes = {}
         for i, t in enumerate(self.HOLE_POSITIONS):
-            mount_hole = t.spec.mount_hole(self.board_size[2], params)
+            mount_hole = mount_holes.get(t.spec.r)
+            if mount_hole is None:
+                mount_hole = t.spec.mount_hole(self.board_size[2], params)
+                mount_holes[t.spec.r] = mount_hole
             anchor_args = t.spec.base_anchor_args.args
             
             maker.add_at(
@@ -256,9 +259,13 @@ def build(self) -> ad.Maker:
                 *anchor_args[0], **anchor_args[1], 
                 post=translate(t.p + (DELTA,)))
 
+        access_shapes = {}
         for outline_layout in self.ALL_ACCESS_ITEMS:
             for name, model, xform in outline_layout.accessor_specs:
-                shape = model.create(params)
+                shape = access_shapes.get(id(model))
+                if shape is None:
+                    shape = model.create(params)
+                    access_shapes[id(model)] = shape
                 maker.add_at(
                     shape.solid(name).colour([0, 1, 0.5]).at(
                         args=model.anchor1, post=translate(model.offset)),
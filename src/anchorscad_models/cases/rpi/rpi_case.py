@@ -222,14 +222,17 @@ def build(self) -> Maker:
         # and then to the top of the case. This uses the intersecting
         # points between the top and bottom planes to find the dimensions
         # of the flange.
+        # The bound lines are shared by both planes so are resolved once.
         support_bound_planes = (self.BOX_TOP, self.CUT_PLANE)
-        support_bound_lines = self.BOUND_LINES
+        support_bound_lines = tuple(la.apply(maker) for la in self.BOUND_LINES)
         
-        top_points = self.find_all_intersect(
-            maker, support_bound_planes[0], *support_bound_lines)
+        top_plane = support_bound_planes[0].apply(maker)
+        top_points = tuple(plane_line_intersect(top_plane, line)
+                           for line in support_bound_lines)
         
-        bottom_points = self.find_all_intersect(
-            maker, support_bound_planes[1], *support_bound_lines)
+        bottom_plane = support_bound_planes[1].apply(maker)
+        bottom_points = tuple(plane_line_intersect(bottom_plane, line)
+                              for line in support_bound_lines)
         
         face_top_locs = []
         for i, m in enumerate(top_points):
@@ -263,15 +266,16 @@ def build(self) -> Maker:
         grille_holes = RectangularGrilleHoles(
             [50, self.wall_thickness + 0.01, self.rhs_grille_size])
         
+        header_corner = self.HEADER_CORNER.apply(maker)
         maker.add_at(grille_holes.hole('rhs_grille').at('centre', post=ROTX_90),
                      post=plane_line_intersect(
                          self.BOX_RHS.apply(maker),
-                         self.HEADER_CORNER.apply(maker)))
+                         header_corner))
         
         maker.add_at(grille_holes.hole('lhs_grille').at('centre', post=ROTX_90),
                      post=plane_line_intersect(
                          self.BOX_LHS.apply(maker),
-                         self.HEADER_CORNER.apply(maker)))
+                         header_corner))
         
         bottom_loc = maker.at('shell', 'face_centre', 1).get_translation()
         screw_hole_loc = maker.at('outline', ('mount_hole', 0), 'top').get_translation()
@@ -298,19 +302,26 @@ def build(self) -> Maker:
         
         params = non_defaults_dict(self, include=('fn', 'fa', 'fs'))
 
+        # Screw holes only differ by the support radius so reuse the shape
+        # for holes with the same spec.
+        board_screw_holes = {}
+        if self.base_mount_screw_hole:
+            base_screw_hole = self.base_mount_screw_hole_node()
         for i, t in enumerate(self.outline_model.HOLE_POSITIONS):
-            board_screw_hole = t.spec.screw_hole(
-                tap_len=max_allowable_screw_hole_height -1,
-                dia=self.board_screw_size, 
-                thru_len=1,
-                params=params)
+            board_screw_hole = board_screw_holes.get(t.spec.r_support)
+            if board_screw_hole is None:
+                board_screw_hole = t.spec.screw_hole(
+                    tap_len=max_allowable_screw_hole_height -1,
+                    dia=self.board_screw_size, 
+                    thru_len=1,
+                    params=params)
+                board_screw_holes[t.spec.r_support] = board_screw_hole
             
             maker.add_at(board_screw_hole
                          .composite(('support', i))
                          .at('start', post=ROTX_180),
                          'outline', ('mount_hole', i), 'top')
             if self.base_mount_screw_hole:
-                base_screw_hole = self.base_mount_screw_hole_node()
                 maker.add_at(base_screw_hole
                             .composite(('base_screw_hole', i))
                             .at('top'),
@@ -112,8 +112,8 @@ def build(self) -> Maker:
                 .line(start_point, 'axis')
                 .build())
         self.path = path
-        self.extents = path.extents()
         extents = path.extents()
+        self.extents = extents
         
         cage_shape = self.cage_shape_node(h=extents[1][1] - extents[0][1], 
                                    r=extents[1][0] - extents[0][0])
@@ -263,11 +263,12 @@ def build(self) -> ad.Maker:
         base_plate_maker = self.base_plate_node().solid('base_plate').at('face_centre', 'base', rh=1)
         maker.add_at(base_plate_maker, 'centre_plate', 'top_centre', post=ad.tranZ(-self.epsilon))
         
+        terminal_shape = self.terminal_node()
         i = 0
         for side in (0, 2):
             for offset in (-1, 1):
                 maker.add_at(
-                    self.terminal_node().solid(('terminal', i)).at('reference'), 
+                    terminal_shape.solid(('terminal', i)).at('reference'), 
                     'base_plate', 'face_edge', 'base', side, post=ad.tranX(offset * self.terminal_sep))
                 i += 1
         
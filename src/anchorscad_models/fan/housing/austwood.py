@@ -363,14 +363,16 @@ def build(self) -> ad.Maker:
             'centre')
         
         # Screw holes.
+        screw_shape = self.screw_node()
+        screw_head_shape = self.screw_head_node()
         for i, anchor in enumerate(self.SCREW_ANCHORS):
             result_maker.add_at(
-                self.screw_node().hole(('screw_hole', i))
+                screw_shape.hole(('screw_hole', i))
                 .at('base', rh=1, h=-self.epsilon / 2), 
                 anchor=anchor)
             
             result_maker.add_at(
-                self.screw_head_node().hole(('screw_head', i))
+                screw_head_shape.hole(('screw_head', i))
                 .at('base'),
                 ('screw_hole', i), 'base')
                 
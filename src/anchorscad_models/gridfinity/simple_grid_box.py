@@ -116,12 +116,14 @@ def build(self) -> ad.Maker:
         
         hole_shape = self.hole_node()
         
+        # All holes are placed relative to the same corner of the box.
+        base_corner = maker.at('face_corner', 'base', 0)
         for i in range(self.nx):
             for j in range(self.ny):
                 box_hole = hole_shape.hole(('hole', i, j )).at('face_corner', 'base', 0)
                 maker = maker.add_at(
                     box_hole,
-                    'face_corner', 'base', 0, post=ad.translate((
+                    post=base_corner * ad.translate((
                         self.t + i * (self.hole_size[0] + self.t),
                         self.t + j * (self.hole_size[1] + self.t),
                         -self.bt)))
@@ -195,19 +197,25 @@ def build(self) -> ad.Maker:
         shape = self.box_node()
         maker = shape.solid('box').at('face_centre', 'base', post=ad.ROTX_180)
         
+        base_corner = maker.at('face_corner', 'base', 0)
+        ysizes = tuple(self.y_size(j) for j in range(self.count_y))
+        hole_z = self.size[2] - self.bt + self.eps
+        # Holes of the same size share a single shape.
+        hole_shapes = {}
         offx = self.t
         for i in range(self.count_x):
             xsize = self.x_size(i)
             offy = self.t
-            for j in range(self.count_y):
-                ysize = self.y_size(j)
-                hole_size = self.hole_size(i, j)
-                hole_shape = self.hole_node(size=hole_size)
+            for j, ysize in enumerate(ysizes):
+                hole_size = (xsize, ysize, hole_z)
+                hole_shape = hole_shapes.get(hole_size)
+                if hole_shape is None:
+                    hole_shape = self.hole_node(size=hole_size)
+                    hole_shapes[hole_size] = hole_shape
                 box_hole = hole_shape.hole(('hole', i, j )).at('face_corner', 'base', 0)
                 maker = maker.add_at(
                     box_hole,
-                    'face_corner', 'base', 0,
-                    post=ad.translate((offx, offy, -self.bt)))
+                    post=base_corner * ad.translate((offx, offy, -self.bt)))
                 offy += ysize + self.t
             offx += xsize + self.t
 
@@ -93,11 +93,12 @@ def build(self) -> ad.Maker:
         spokes_mode = (ad.ModeShapeFrame.HOLE 
                 if self.as_cutout 
                 else ad.ModeShapeFrame.SOLID)
+        spoke_offset = ad.tranZ(-self.h - self.epsilon / 2)
         for i in range(count):
             maker.add_at(shape
                          .named_shape(('spoke', i), spokes_mode)
                          .at(post=ad.rotZ(i * 360 / count)),
-                         'base', post=ad.tranZ(-self.h - self.epsilon / 2)
+                         'base', post=spoke_offset
                          )
             
         
@@ -54,11 +54,14 @@ class HingeHole(ad.CompositeShape):
     rx_path: ad.Path=ad.dtfield(self_default=lambda s:s.path_node().build())
     extrude_node: ad.Node=ad.ShapeNode(ad.RotateExtrude, prefix='rx_')
     
+    rx_path_extents: tuple=ad.dtfield(
+            self_default=lambda s: s.rx_path.extents(),
+            init=False)
     cage_r: float=ad.dtfield(
-            self_default=lambda s: s.rx_path.extents()[1][0],
+            self_default=lambda s: s.rx_path_extents[1][0],
             init=False)
     cage_h: float=ad.dtfield(
-            self_default=lambda s: s.rx_path.extents()[1][1],
+            self_default=lambda s: s.rx_path_extents[1][1],
             init=False)
     cage_node: ad.Node=ad.dtfield(
             ad.ShapeNode(ad.Cylinder, prefix='cage_'), init=False)
@@ -372,18 +375,17 @@ def build(self) -> ad.Maker:
                        seg_count + 1, 
                        2):
             
-            target_from=self.anchor_for(i - 1)
-            length = self.length_between(
-                maker,
-                target_from=target_from, 
-                target_to=self.anchor_for(i,
-                        post=ad.tranZ(-sep)))
+            # Resolve the anchors once, the from frame is also the sleeve
+            # location.
+            from_frame = self.anchor_for(i - 1).apply(maker)
+            to_frame = self.anchor_for(i, post=ad.tranZ(-sep)).apply(maker)
+            length = ad.distance_between(from_frame, to_frame)
             
             sleeve = self.hinge_bar_shape.gen_sleeve(length, self.side)
             
             maker.add_at(sleeve.solid(('sleeve', i))
                          .at('base'),
-                         anchor=target_from)
+                         post=from_frame)
             
         if not self.side:
             end = self.hinge_bar_shape.gen_end(sep)
@@ -99,8 +99,7 @@ def __post_init__(self):
         taper_angle = 181.5
         flange.add_at(intersector.solid('intersector')
                       .at('face_centre', 1, 
-                          post=ad.rotY(taper_angle) * ad.tranZ(-raised_taper)), 
-                      post=ad.IDENTITY)
+                          post=ad.rotY(taper_angle) * ad.tranZ(-raised_taper)))
         
         extents = path.extents()
         
@@ -242,20 +241,22 @@ class LensCap(ad.CompositeShape):
     def build(self) -> ad.Maker:
         maker = self.assembly_node().composite('assembly').at()
 
+        if self.grip_rib_as_recess:
+            orientation = ad.IDENTITY
+            zoffs = self.grip_rib_zoffs
+            msf = ad.ModeShapeFrame.HOLE
+        else:
+            orientation = ad.ROTX_180
+            zoffs = -self.grip_rib_zoffs
+            msf = ad.ModeShapeFrame.SOLID 
+
+        # All ribs are the same shape, only the placement differs.
+        grip_rib_shape = self.grip_rib_node()
         for i in range(self.grip_rib_count):
 
             angle = (360 / self.grip_rib_count) * i
-            
-            if self.grip_rib_as_recess:
-                orientation = ad.IDENTITY
-                zoffs = self.grip_rib_zoffs
-                msf = ad.ModeShapeFrame.HOLE
-            else:
-                orientation = ad.ROTX_180
-                zoffs = -self.grip_rib_zoffs
-                msf = ad.ModeShapeFrame.SOLID 
-
-            rib_maker = self.grip_rib_node().named_shape(('grip_rib', i), msf) \
+
+            rib_maker = grip_rib_shape.named_shape(('grip_rib', i), msf) \
                 .at('base', 0.5, rh=0.5, post=ad.ROTZ_90 * orientation)
             maker.add_at(
                 rib_maker,
@@ -167,10 +167,11 @@ def build(self):
                                          'tabs', 'key')
         
         thumbhole = self.thumbhole_node()
+        thumbhole_xform = ad.ROTX_270 * ad.tranY(17) * ad.tranZ(3)
         
         for i in range(3):
             maker.add_at(thumbhole.hole(('thumb', i)).at('base'), 
-                         'tabs', 'key', i, post=ad.ROTX_270 * ad.tranY(17) * ad.tranZ(3))
+                         'tabs', 'key', i, post=thumbhole_xform)
         
         return maker    
 
@@ -203,17 +203,19 @@ class DrainHolder(ad.CompositeShape):
     
     profile_node: ad.Node=ad.Node(DrainHolderProfile)
     holder_path: ad.Path=ad.dtfield(self_default=lambda s: s.profile_node().build())
+    holder_extents: tuple=ad.dtfield(
+        self_default=lambda s: s.holder_path.extents(), init=False, doc='Extents of holder path')
     rotate_extrude_node: ad.Node=ad.ShapeNode(ad.RotateExtrude, prefix='holder_')
 
     reinforcer_hole_inside_r: float=ad.dtfield(3.2, doc='Inner radius of hole for reinforcer rod')
     reinforcer_hole_outside_r: float=ad.dtfield(5, doc='Outer radius of hole for reinforcer rodd')
     reinforcer_hole_h: float=ad.dtfield(
-        self_default=lambda s: path_height(s.holder_path), doc='Height of hole for reinforcer rod')
+        self_default=lambda s: extents_to_height(s.holder_extents), doc='Height of hole for reinforcer rod')
     reinforcer_pipe_node: ad.Node=ad.ShapeNode(Pipe, prefix='reinforcer_hole_', expose_all=True)
     reinforcer_count: int=ad.dtfield(3, doc='Number of reinforcer rods')
 
     snap_hole_r: float=ad.dtfield(3.2, doc='Radius of snap hole')
-    snap_hole_h: float=ad.dtfield(self_default=lambda s: 2 + path_width(s.holder_path), doc='Height of snap hole')
+    snap_hole_h: float=ad.dtfield(self_default=lambda s: 2 + extents_to_width(s.holder_extents), doc='Height of snap hole')
     snap_hole_node: ad.Node=ad.ShapeNode(ad.Cylinder, prefix='snap_hole_')
     snap_hole_count: int=ad.dtfield(2, doc='Number of snap holes')
     snap_hole_angle_offset: float=ad.dtfield(20, doc='Angle offset of snap holes')
@@ -233,7 +235,7 @@ class DrainHolder(ad.CompositeShape):
     grate_thickness: float=ad.dtfield(2, doc='Thickness of grate')
     grate_size: tuple=ad.dtfield(
         self_default=lambda s: 
-            (s.grate_thickness, 2 * s.inside_r - 1, path_height(s.holder_path)))
+            (s.grate_thickness, 2 * s.inside_r - 1, extents_to_height(s.holder_extents)))
 
     grate_node: ad.Node=ad.ShapeNode(ad.Box, prefix='grate_')
 
@@ -273,6 +275,7 @@ def build(self) -> ad.Maker:
                 'holder', 'top_edge', -0.5, angle=i * 360 / self.reinforcer_count, post=ad.ROTX_90)
             
         snap_hole_shape = self.snap_hole_node()
+        snap_hole_xform = ad.tranZ(self.pipe_side_h - self.snap_hole_z_pos)
         for i in range(self.snap_hole_count):
             maker.add_at(
                 snap_hole_shape
@@ -280,9 +283,12 @@ def build(self) -> ad.Maker:
                     .at('surface'),
                 'holder', 'top_edge', -0.5,
                 angle=i * 360 / self.snap_hole_count + self.snap_hole_angle_offset,
-                post=ad.tranZ(self.pipe_side_h - self.snap_hole_z_pos))
+                post=snap_hole_xform)
             
         bottom_hole_shape = self.bottom_hole_node()
+        bottom_hole_xform = (ad.tranZ(self.bottom_hole_z_pos) 
+                             * ad.tranY(self.bottom_hole_offset) 
+                             * ad.ROTZ_90)
         for i in range(self.bottom_hole_count):
             maker.add_at(
                 bottom_hole_shape
@@ -290,7 +296,7 @@ def build(self) -> ad.Maker:
                     .at('base'),
                 'holder', 'wedge', 0.5,
                 angle=i * 360 / self.bottom_hole_count + self.bottom_hole_angle_offset,
-                post=ad.tranZ(self.bottom_hole_z_pos) * ad.tranY(self.bottom_hole_offset) * ad.ROTZ_90)
+                post=bottom_hole_xform)
 
         return maker
 
@@ -82,6 +82,43 @@ def build(self) -> ad.Maker:
 def radians(degs):
     return np.pi * (degs / 180.0)
 
+def kite_upper_point(angle, min_w, h):
+    '''Returns the (x, y) position of the upper side corners of a
+    DresdenKite. Only the dimensions are computed, no shape is built.'''
+    
+    # draw a triangle on extending to the intersection of the 
+    # kite side and the y axis. Compute the lengths.
+    a1 = angle / 2
+    a2 = 45
+    a3 = 180 - a1 - a2
+    
+    # Use sine rule to find lengths.
+    # https://docs.google.com/document/d/1z8y6XxkwhxLyFvRFRf0xYBrSVRRi6N9ON-V0Xb9OB8Q/edit?usp=sharing
+    sa1 = np.sin(radians(a1))
+    ta1 = np.tan(radians(a1))
+    sa2 = np.sin(radians(a2))
+    ca2 = np.cos(radians(a2))
+    sa3 = np.sin(radians(a3))
+    
+    lower_x = min_w / 2
+    yil = -lower_x / ta1
+    
+    y1 = h - yil
+    
+    sinerule_ratio = y1 / sa3
+    
+    la1 = sinerule_ratio * sa1
+    
+    upper_x = la1 * sa2
+    upper_y = h - la1 * ca2
+    
+    ta1_ac = (upper_x - lower_x) / upper_y
+    if np.abs(ta1_ac - ta1) > 1e-10:
+        assert (f'Error in computation. tan of a1 ({ta1}) should match'
+         + f' the actual {ta1_ac}')
+    
+    return upper_x, upper_y
+
 @ad.shape
 @ad.datatree
 class DresdenKite(ad.CompositeShape):
@@ -98,40 +135,12 @@ class DresdenKite(ad.CompositeShape):
     
     def build(self) -> ad.Maker:
         
-        # draw a triangle on extending to the intersection of the 
-        # kite side and the y axis. Compute the lengths.
-        a1 = self.angle / 2
-        a2 = 45
-        a3 = 180 - a1 - a2
-        
-        # Use sine rule to find lengths.
-        # https://docs.google.com/document/d/1z8y6XxkwhxLyFvRFRf0xYBrSVRRi6N9ON-V0Xb9OB8Q/edit?usp=sharing
-        sa1 = np.sin(radians(a1))
-        ta1 = np.tan(radians(a1))
-        sa2 = np.sin(radians(a2))
-        ca2 = np.cos(radians(a2))
-        sa3 = np.sin(radians(a3))
-        
         lower_x = self.min_w / 2
-        yil = -lower_x / ta1
-        
-        y1 = self.h - yil
-        
-        sinerule_ratio = y1 / sa3
-        
-        la1 = sinerule_ratio * sa1
-        
-        upper_x = la1 * sa2
-        upper_y = self.h - la1 * ca2
+        upper_x, upper_y = kite_upper_point(self.angle, self.min_w, self.h)
         
         self.upper_x = upper_x
         self.upper_y = upper_y
         
-        ta1_ac = (upper_x - lower_x) / upper_y
-        if np.abs(ta1_ac - ta1) > 1e-10:
-            assert (f'Error in computation. tan of a1 ({ta1}) should match'
-             + f' the actual {ta1_ac}')
-        
         path = (ad.PathBuilder()
             .move([0, 0])
             .line([-lower_x, 0], 'lower_left')
@@ -170,15 +179,13 @@ class DresdenBorder(ad.CompositeShape):
                             ad.args(render_small=False))}
     
     def build(self) -> ad.Maker:
-        # Use DresdenKite to compute upper_y - without seam allowance.
+        # Compute the DresdenKite upper_y - without seam allowance. Only the
+        # dimension is needed so the kite shape itself is not built.
         side_seam_allowance = SEAM_ALLOWANCE / np.cos(radians(self.angle / 2))
-        kite = DresdenKite(
+        _, upper_y = kite_upper_point(
             angle=self.angle,
             min_w=self.min_w - 2 * side_seam_allowance,
-            h=self.h - 2 * SEAM_ALLOWANCE,
-            t=self.t)
-        
-        upper_y = kite.upper_y
+            h=self.h - 2 * SEAM_ALLOWANCE)
         print(upper_y / INCH)
         if self.render_small:
             shape = DresdenWedge(
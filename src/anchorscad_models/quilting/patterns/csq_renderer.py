@@ -4,10 +4,12 @@
 @uthor: 	gianni
 '''
 
+import io
 from typing import List, Tuple
 import datatrees as dt
 import numpy as np
 from anchorscad.svg_renderer import Segments, Segment
+from anchorscad_models.quilting.patterns.mm_export import _write_joined
 
 
 def _cubic_bezier_for_arc(
@@ -170,10 +172,18 @@ def construction(self, css_clazz='construction', shape_css_class='construction_s
             path_renderer=self)
 
     def write(self, filename, encoding="utf-8"):
-        '''Writes the csq data to a file.
+        '''Writes the csq data to a file, one path at a time. This avoids
+        joining the paths into a single string but get_paths() still holds
+        every path string in memory.
         Args:
-            filename: The filename to create.
+            filename: The filename to create or an open text stream. Streams
+                are written to but not closed.
+        Returns the number of characters written.
         '''
+        if isinstance(filename, io.TextIOBase):
+            return self._write_paths(filename)
         with open(filename, 'w', encoding=encoding) as fp:
-            paths = self.get_paths()
-            return fp.write('\n\n'.join(paths) + '\n')
+            return self._write_paths(fp)
+
+    def _write_paths(self, fp):
+        return _write_joined(fp, self.get_paths(), '\n\n') + fp.write('\n')
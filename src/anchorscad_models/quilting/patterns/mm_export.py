@@ -4,9 +4,10 @@
 
 from __future__ import annotations
 
+import io
 import subprocess
 from pathlib import Path
-from typing import List, Union
+from typing import Iterable, Iterator, Union
 
 import anchorscad as ad
 import anchorscad.svg_renderer as svgr
@@ -32,13 +33,16 @@ def parse_page_size(spec: str) -> tuple[float, float]:
         f'Unknown page size {spec!r}; use A4, A3, A5, LETTER, LEGAL, or WIDTHxHEIGHT')
 
 
-def path_to_mm_svg(
+def iter_mm_svg(
         path: ad.Path,
         margin_mm: float = 5.0,
         stroke_mm: float = 0.3,
         include_constructions: bool = True,
-        page_size_mm: tuple[float, float] | None = None) -> str:
-    '''Build an SVG string with 1 user unit = 1 mm (model coordinates).'''
+        page_size_mm: tuple[float, float] | None = None) -> Iterator[str]:
+    '''Return an iterator over the lines of an SVG document with 1 user
+    unit = 1 mm (model coordinates). Lines are yielded without line
+    terminators. The path is rendered and measured before this returns so
+    any errors are raised before the first line is consumed.'''
     renderer = svgr.SvgPathRenderer(
         path_id='pattern', all_segments=None, is_path_closed=False)
     path.svg_path_render(renderer)
@@ -60,44 +64,90 @@ def path_to_mm_svg(
     tx = page_offset_x + margin_mm - x0
     ty = page_offset_y + margin_mm + y1
 
-    path_elems: List[str] = []
+    return _iter_mm_svg_lines(renderer, width_mm, height_mm, stroke_mm, tx, ty)
+
+
+def _iter_mm_svg_lines(
+        renderer: svgr.SvgPathRenderer,
+        width_mm: float,
+        height_mm: float,
+        stroke_mm: float,
+        tx: float,
+        ty: float) -> Iterator[str]:
+    '''Yield the SVG document lines for an already rendered path.'''
+    yield '<?xml version="1.0" encoding="UTF-8"?>'
+    yield (f'<svg xmlns="http://www.w3.org/2000/svg" '
+           f'width="{width_mm:G}mm" height="{height_mm:G}mm" '
+           f'viewBox="0 0 {width_mm:G} {height_mm:G}">')
+    yield (f'<style>path {{ fill: none; stroke: #000; '
+           f'stroke-width: {stroke_mm:G}mm; }}</style>')
+    yield f'<g transform="translate({tx:G},{ty:G}) scale(1,-1)">'
     for path_segment in renderer.get_paths():
-        path_elems.append(f'<path d="{path_segment.shape_str}"/>')
+        yield f'<path d="{path_segment.shape_str}"/>'
     for _seg_id, segment in renderer.get_segments().items():
-        path_elems.append(f'<path d="{segment.path}"/>')
-
-    return '\n'.join((
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        (f'<svg xmlns="http://www.w3.org/2000/svg" '
-         f'width="{width_mm:G}mm" height="{height_mm:G}mm" '
-         f'viewBox="0 0 {width_mm:G} {height_mm:G}">'),
-        (f'<style>path {{ fill: none; stroke: #000; '
-         f'stroke-width: {stroke_mm:G}mm; }}</style>'),
-        f'<g transform="translate({tx:G},{ty:G}) scale(1,-1)">',
-        *path_elems,
-        '</g>',
-        '</svg>',
-    ))
+        yield f'<path d="{segment.path}"/>'
+    yield '</g>'
+    yield '</svg>'
+
+
+def path_to_mm_svg(
+        path: ad.Path,
+        margin_mm: float = 5.0,
+        stroke_mm: float = 0.3,
+        include_constructions: bool = True,
+        page_size_mm: tuple[float, float] | None = None) -> str:
+    '''Build an SVG string with 1 user unit = 1 mm (model coordinates).'''
+    return '\n'.join(iter_mm_svg(
+        path,
+        margin_mm=margin_mm,
+        stroke_mm=stroke_mm,
+        include_constructions=include_constructions,
+        page_size_mm=page_size_mm))
+
+
+def _write_joined(
+        fp: io.TextIOBase, items: Iterable[str], separator: str = '\n') -> int:
+    '''Write items to a text stream as they are produced, with separator
+    between them (as separator.join(items) would). Returns the number of
+    characters written.'''
+    count = 0
+    sep = ''
+    for item in items:
+        count += fp.write(sep)
+        count += fp.write(item)
+        sep = separator
+    return count
 
 
 def write_mm_svg(
         path: ad.Path,
-        filename: Union[str, Path],
+        filename: Union[str, Path, io.TextIOBase],
         margin_mm: float = 5.0,
         stroke_mm: float = 0.3,
         include_constructions: bool = True,
         page_size_mm: tuple[float, float] | None = PAGE_SIZES_MM['A4'],
-        encoding: str = 'utf-8') -> Path:
-    '''Write an mm-accurate SVG file.'''
+        encoding: str = 'utf-8') -> Union[Path, io.TextIOBase]:
+    '''Write an mm-accurate SVG file. The path is rendered before the file
+    is opened, then the document is written line by line, which avoids
+    joining it into a single string. The rendered path strings themselves
+    are still held by the renderer.
+    Args:
+        filename: A file name or an open text stream (e.g. a pipe). Streams
+            are written to but not closed and encoding is ignored.
+    Returns the Path written or the given stream.
+    '''
+    lines = iter_mm_svg(
+        path,
+        margin_mm=margin_mm,
+        stroke_mm=stroke_mm,
+        include_constructions=include_constructions,
+        page_size_mm=page_size_mm)
+    if isinstance(filename, io.TextIOBase):
+        _write_joined(filename, lines)
+        return filename
     out = Path(filename)
-    out.write_text(
-        path_to_mm_svg(
-            path,
-            margin_mm=margin_mm,
-            stroke_mm=stroke_mm,
-            include_constructions=include_constructions,
-            page_size_mm=page_size_mm),
-        encoding=encoding)
+    with out.open('w', encoding=encoding) as fp:
+        _write_joined(fp, lines)
     return out
 
 
@@ -6,7 +6,7 @@
 import anchorscad.svg_renderer as svgr
 from anchorscad_models.quilting.patterns.csq_renderer import CsqPathRenderer
 from anchorscad_models.quilting.patterns.mm_export import (
-    parse_page_size, write_mm_pdf, write_mm_svg)
+    parse_page_size, write_mm_pdf)
 import argparse as ap
 from dataclasses import dataclass, field
 from typing import List
@@ -76,13 +76,8 @@ def run(self, argv: List[str] = None):
             csq_renderer.write('test.csq')
 
         if argp.pdf:
+            # write_mm_pdf also leaves the intermediate test_mm.svg behind.
             page_size_mm = parse_page_size(argp.pdf_page_size)
-            write_mm_svg(
-                self.svgr_path,
-                'test_mm.svg',
-                margin_mm=argp.pdf_margin,
-                stroke_mm=argp.pdf_stroke,
-                page_size_mm=page_size_mm)
             write_mm_pdf(
                 self.svgr_path,
                 'test.pdf',
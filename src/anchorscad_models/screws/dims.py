@@ -7,7 +7,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShaftDimensions(object):
     '''Contains diameter dimensions for a screw type.
     '''
@@ -16,7 +16,7 @@ class ShaftDimensions(object):
     tapping_d: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeadDimensions(object):
     '''Contains dimensions for a screw type.
     '''
@@ -90,7 +90,7 @@ def overall_screw_head_height(self):
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HoleDimensions(object):
     '''Contains dimensions for screw holes.
     '''
@@ -47,6 +47,10 @@ def build(self) -> ad.Maker:
         params = ad.non_defaults_dict(self, include=('fn', 'fa', 'fs'))
         fnparams = ad.non_defaults_dict(self, include=('fn',))
         
+        hole_corner = maker.at('face_corner', 1, 2)
+        label_corner = maker.at('face_corner', 4, 0)
+        label_offset = ad.translate([0, -self.text_size /2, 0.01])
+        
         size_incr = (self.size_range[1] - self.size_range[0]) / (self.count - 1)
         for i in range(self.count):
             hole_size = self.dia / 2 + self.size_range[0] + i * size_incr
@@ -54,13 +58,13 @@ def build(self) -> ad.Maker:
             maker.add_at(
                 pipe.Pipe(self.outer_stem_height, hole_size, pipe_outer_r / 2, **params)
                     .composite(('hole', i)).colour([0, 1, 0]).at('base'),
-                'face_corner', 1, 2, pre=pre
+                post=pre * hole_corner
                 )
             maker.add_at(
                 ad.Text(f'{hole_size * 2:3.2f}', size=self.text_size, 
                           font='Ubuntu Mono:style=Bold', **fnparams
                           ).hole(('label', i)).colour([1, 0, 0]).at('default', 'front'),
-                'face_corner', 4, 0, pre=pre * ad.translate([0, -self.text_size /2, 0.01]))
+                post=pre * label_offset * label_corner)
 
         return maker
     